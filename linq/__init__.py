@@ -1,3 +1,4 @@
 from .linq import Linq
+from .cache import ResultCache
 
-__all__: list[str] = ['Linq']
+__all__: list[str] = ['Linq', 'ResultCache']
@@ -0,0 +1,283 @@
+import hashlib
+import os
+import pickle
+import tempfile
+import time
+
+from typing import TYPE_CHECKING, BinaryIO, Callable, Generator, Iterable, List, Optional, Sequence, Tuple, Union, Any, cast, Final
+
+if TYPE_CHECKING:
+    from .linq import Linq
+
+PathLike = Union[str, 'os.PathLike[str]']
+
+ENTRY_SUFFIX: Final[str] = '.pickle'
+TEMP_SUFFIX: Final[str] = '.tmp'
+HASH_CHUNK_SIZE: Final[int] = 1 << 20
+
+
+def write_stream(handle: BinaryIO, items: Iterable[Any]) -> None:
+    """
+    Writes every element of the iterable to the handle as a sequence of pickle records.
+
+    Args:
+        handle (BinaryIO): A binary file opened for writing.
+        items (Iterable[Any]): The elements to write.
+    """
+    pickler = pickle.Pickler(handle, protocol=pickle.HIGHEST_PROTOCOL)
+    for item in items:
+        pickler.dump(item)
+        pickler.clear_memo()
+
+
+def load_stream(handle: BinaryIO) -> Generator[Any, None, None]:
+    """
+    Lazily reads the pickle records written by `write_stream`, closing the handle once exhausted.
+
+    Args:
+        handle (BinaryIO): A binary file positioned at the first record.
+
+    Yields:
+        Any: The stored elements, in the order they were written.
+    """
+    try:
+        unpickler = pickle.Unpickler(handle)
+        while True:
+            try:
+                yield unpickler.load()
+            except EOFError:
+                return
+    finally:
+        handle.close()
+
+
+def read_stream(path: PathLike) -> Generator[Any, None, None]:
+    """
+    Lazily reads the pickle records stored in a file.
+
+    The file is only opened once iteration starts, so an unused generator holds no file descriptor.
+
+    Args:
+        path (PathLike): A file written by `write_stream`.
+
+    Yields:
+        Any: The stored elements, in the order they were written.
+    """
+    yield from load_stream(open(path, 'rb'))
+
+
+def fingerprint(key: Any, source: Optional[Union[PathLike, Sequence[PathLike]]] = None,
+                hash_source: bool = False) -> str:
+    """
+    Builds a stable fingerprint from a pipeline key and the version of its source files.
+
+    Args:
+        key (Any): A token describing the pipeline. Its `repr` must be stable across processes,
+            so strings, numbers and tuples of them are the safest choice.
+        source (Optional[Union[PathLike, Sequence[PathLike]]]): One or more files the pipeline reads.
+            Their absolute path, modification time and size become part of the fingerprint.
+        hash_source (bool): If True, the content of the source files is hashed as well. Defaults to False.
+
+    Returns:
+        str: A hexadecimal digest identifying the pipeline result.
+
+    Example:
+        >>> fingerprint('report-v1') == fingerprint('report-v1')
+        True
+    """
+    digest = hashlib.sha256(repr(key).encode('utf-8'))
+    if source is None:
+        paths: List[PathLike] = []
+    elif isinstance(source, (str, os.PathLike)):
+        paths = [source]
+    else:
+        paths = list(source)
+    for path in paths:
+        stat = os.stat(path)
+        digest.update(f'\0{os.path.abspath(path)}:{stat.st_mtime_ns}:{stat.st_size}'.encode('utf-8'))
+        if hash_source:
+            with open(path, 'rb') as fh:
+                for chunk in iter(lambda: fh.read(HASH_CHUNK_SIZE), b''):
+                    digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ResultCache:
+    def __init__(self, directory: PathLike, max_bytes: Optional[int] = None,
+                 max_entries: Optional[int] = None, stale_after: float = 24 * 60 * 60) -> None:
+        """
+        Initialize a new on-disk store for pipeline results.
+
+        Entries are written to a temporary file and atomically renamed into place, so several
+        processes may share the same directory. When `max_bytes` or `max_entries` is exceeded,
+        the least recently used entries are evicted. Temporary files left behind by writers that died
+        are removed once they have not been written to for `stale_after` seconds.
+
+        Args:
+            directory (PathLike): The directory holding the entries. It is created if missing.
+            max_bytes (Optional[int]): The maximum total size of the entries. Defaults to no limit.
+            max_entries (Optional[int]): The maximum number of entries. Defaults to no limit.
+            stale_after (float): The age in seconds after which an abandoned temporary file is removed.
+                Defaults to one day.
+        """
+        self.directory: str = os.fspath(directory)
+        self.max_bytes: Optional[int] = max_bytes
+        self.max_entries: Optional[int] = max_entries
+        self.stale_after: float = stale_after
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + ENTRY_SUFFIX)
+
+    @staticmethod
+    def _touch(path: str) -> None:
+        now = time.time_ns()
+        try:
+            os.utime(path, ns=(now, now))
+        except OSError:
+            pass
+
+    @staticmethod
+    def _remove(path: str) -> bool:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        except OSError:
+            return False
+        return True
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Looks up the entry stored under the given fingerprint and marks it as recently used.
+
+        Args:
+            key (str): The fingerprint of the entry.
+
+        Returns:
+            Optional[str]: The path of the entry, or None on a miss.
+        """
+        path = self._path(key)
+        if not os.path.exists(path):
+            return None
+        self._touch(path)
+        return path
+
+    def put(self, key: str, items: Iterable[Any]) -> str:
+        """
+        Stores the elements of the iterable under the given fingerprint.
+
+        Args:
+            key (str): The fingerprint of the entry.
+            items (Iterable[Any]): The elements to store. They must be picklable.
+
+        Returns:
+            str: The path of the entry.
+        """
+        path = self._path(key)
+        with tempfile.NamedTemporaryFile(dir=self.directory, prefix='.', suffix=TEMP_SUFFIX, delete=False) as handle:
+            try:
+                write_stream(cast(BinaryIO, handle), items)
+            except BaseException:
+                handle.close()
+                self._remove(handle.name)
+                raise
+        os.replace(handle.name, path)
+        self._touch(path)
+        self.evict(keep=key)
+        return path
+
+    def cached(self, key: Any, build: Callable[[], Iterable[Any]],
+               source: Optional[Union[PathLike, Sequence[PathLike]]] = None,
+               hash_source: bool = False) -> 'Linq[Any]':
+        """
+        Returns the stored result of a pipeline, building and storing it only on a miss.
+
+        The fingerprint is computed before `build` is called, so on a hit the pipeline is never
+        constructed and none of its steps run, including eager ones such as `group_by` and `order_by`.
+
+        Args:
+            key (Any): A token describing the pipeline, e.g. a name and a version. Change it whenever the
+                pipeline itself changes.
+            build (Callable[[], Iterable[Any]]): A function that builds the pipeline.
+            source (Optional[Union[PathLike, Sequence[PathLike]]]): The file or files the pipeline reads. Defaults to None.
+            hash_source (bool): If True, the content of the source files is hashed as well. Defaults to False.
+
+        Returns:
+            Linq[Any]: A new Linq object streaming the stored elements.
+
+        Example:
+            >>> store = ResultCache('/tmp/linq-cache')
+            >>> build = lambda: Linq(['apple', 'banana', 'apricot']).group_by(lambda x: x[0])
+            >>> result = store.cached('fruits-v1', build).to_list()
+            >>> print(result)
+            [('a', ['apple', 'apricot']), ('b', ['banana'])]
+        """
+        from .linq import Linq
+
+        entry = fingerprint(key, source, hash_source)
+        path = self.get(entry)
+        if path is None:
+            path = self.put(entry, build())
+        return Linq(read_stream(path))
+
+    def entries(self) -> List[Tuple[int, int, str]]:
+        """
+        Lists the stored entries.
+
+        Returns:
+            List[Tuple[int, int, str]]: Tuples of last use time in nanoseconds, size and path,
+            least recently used first.
+        """
+        return sorted(self._scan(ENTRY_SUFFIX))
+
+    def _scan(self, suffix: str) -> List[Tuple[int, int, str]]:
+        files = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(suffix):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime_ns, stat.st_size, path))
+        return files
+
+    def _remove_stale(self) -> None:
+        cutoff = time.time_ns() - int(self.stale_after * 1e9)
+        for mtime, _, path in self._scan(TEMP_SUFFIX):
+            if mtime < cutoff:
+                self._remove(path)
+
+    def evict(self, keep: Optional[str] = None) -> None:
+        """
+        Removes abandoned temporary files and the least recently used entries until the store fits its limits.
+
+        Args:
+            keep (Optional[str]): A fingerprint that must not be evicted. Defaults to None.
+        """
+        self._remove_stale()
+        if self.max_bytes is None and self.max_entries is None:
+            return
+        kept = self._path(keep) if keep is not None else None
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        count = len(entries)
+        for _, size, path in entries:
+            over_bytes = self.max_bytes is not None and total > self.max_bytes
+            over_entries = self.max_entries is not None and count > self.max_entries
+            if not (over_bytes or over_entries):
+                break
+            if path == kept or not self._remove(path):
+                continue
+            total -= size
+            count -= 1
+
+    def clear(self) -> None:
+        """
+        Removes every entry and abandoned temporary file from the store.
+        """
+        self._remove_stale()
+        for _, _, path in self.entries():
+            self._remove(path)
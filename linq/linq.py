@@ -1,10 +1,14 @@
 import sys
+import tempfile
 
 from itertools import islice, groupby, takewhile, dropwhile, zip_longest
-from typing import Generator, Iterable, Callable, Iterator, TypeVar, Generic, List, Optional, Tuple, Any, cast, Final
+from typing import Generator, Iterable, Callable, Iterator, TypeVar, Generic, List, Optional, Sequence, Tuple, Union, Any, cast, Final
 
 from more_itertools import first, interleave_longest, last, chunked, unique_everseen
 
+from .cache import PathLike, ResultCache, load_stream
+from .shuffle import check_partitions, count_partition, group_partition, partition, shard_of, shuffle, unique_partition
+
 PYTHON_VERSION: Final[Tuple[int, int]] = sys.version_info[:2]
 
 T = TypeVar('T')
@@ -478,6 +482,186 @@ class Linq(Generic[T]):
         """
         return Linq(interleave_longest(self.iterable, *others))
 
+    def partition_by(self, key: Callable[[T], Any], n: int, spill: bool = False) -> 'Linq[Linq[T]]':
+        """
+        Hash-partitions the elements into `n` shards, so that elements with equal keys share a shard.
+
+        Args:
+            key (Callable[[T], Any]): A function that returns the partition key of an element.
+            n (int): The number of shards.
+            spill (bool): If True, shards are written to temporary files instead of being kept in memory.
+                The elements must then be picklable and each shard can only be iterated once. Defaults to False.
+
+        Returns:
+            Linq[Linq[T]]: A new Linq object with one Linq object per shard.
+
+        Raises:
+            ValueError: If `n` is less than 1.
+
+        Example:
+            >>> linq = Linq([1, 2, 3, 4, 5, 6])
+            >>> result = linq.partition_by(lambda x: x % 2, 2).select(lambda shard: shard.to_list()).to_list()
+            >>> print(result)
+            [[2, 4, 6], [1, 3, 5]]
+        """
+
+        def split(iterable: Iterable[T]) -> Generator['Linq[T]', None, None]:
+            if spill:
+                handles = [tempfile.TemporaryFile() for _ in range(n)]
+                partition(iterable, key, handles)
+                for handle in handles:
+                    handle.seek(0)
+                    yield Linq(load_stream(handle))
+            else:
+                shards: List[List[T]] = [[] for _ in range(n)]
+                for item in iterable:
+                    shards[shard_of(key(item), n)].append(item)
+                yield from map(Linq, shards)
+
+        check_partitions(n)
+        return Linq(split(self.iterable))
+
+    def parallel_group_by(self, key_func: Callable[[T], K], partitions: int,
+                          processes: Optional[int] = None) -> 'Linq[Tuple[K, List[T]]]':
+        """
+        Groups the elements like `group_by`, spilling them into hash partitions that are grouped in a process pool.
+
+        No process holds more than one partition in memory. Groups are ordered by key within each
+        partition, and the partitions are concatenated. Unlike `group_by`, the keys must be hashable,
+        and both the elements and their keys must be picklable.
+
+        Args:
+            key_func (Callable[[T], K]): A function that maps each element of the iterable to a key.
+            partitions (int): The number of partitions.
+            processes (Optional[int]): The number of worker processes. Defaults to the number of CPUs.
+
+        Returns:
+            Linq[Tuple[K, List[T]]]: A new Linq object containing tuples of keys and lists of grouped elements.
+
+        Raises:
+            ValueError: If `partitions` is less than 1.
+
+        Example:
+            >>> linq = Linq(['apple', 'banana', 'apricot', 'blueberry'])
+            >>> result = linq.parallel_group_by(lambda x: x[0], 4).order_by(lambda x: x[0]).to_list()
+            >>> print(result)
+            [('a', ['apple', 'apricot']), ('b', ['banana', 'blueberry'])]
+        """
+        check_partitions(partitions)
+        return Linq(shuffle(self.iterable, key_func, partitions, group_partition, processes))
+
+    def parallel_unique_seen(self, partitions: int, key: Optional[Callable[[T], Any]] = None,
+                             processes: Optional[int] = None) -> 'Linq[T]':
+        """
+        Returns unique elements, deduplicating hash partitions in a process pool.
+
+        No process holds more than one partition's keys in memory. The first element seen for each key
+        is kept, but the order is only preserved within each partition. Unlike `unique_seen`, the keys
+        must be hashable, and both the elements and their keys must be picklable.
+
+        Args:
+            partitions (int): The number of partitions.
+            key (Optional[Callable[[T], Any]]): A function that returns the value compared for uniqueness.
+                Defaults to None, meaning the elements themselves are compared.
+            processes (Optional[int]): The number of worker processes. Defaults to the number of CPUs.
+
+        Returns:
+            Linq[T]: A new Linq object with unique elements.
+
+        Raises:
+            ValueError: If `partitions` is less than 1.
+
+        Example:
+            >>> linq = Linq(['Apple', 'banana', 'apple', 'Banana', 'CHERRY'])
+            >>> result = linq.parallel_unique_seen(4, key=lambda x: x.lower()).order_by(str.lower).to_list()
+            >>> print(result)
+            ['Apple', 'banana', 'CHERRY']
+        """
+        check_partitions(partitions)
+        return Linq(shuffle(self.iterable, key, partitions, unique_partition, processes))
+
+    def parallel_distinct(self, partitions: int, processes: Optional[int] = None) -> 'Linq[T]':
+        """
+        Returns distinct elements like `distinct`, deduplicating hash partitions in a process pool.
+
+        The elements must be hashable and picklable.
+
+        Args:
+            partitions (int): The number of partitions.
+            processes (Optional[int]): The number of worker processes. Defaults to the number of CPUs.
+
+        Returns:
+            Linq[T]: A new Linq object with distinct elements.
+
+        Raises:
+            ValueError: If `partitions` is less than 1.
+
+        Example:
+            >>> linq = Linq([1, 2, 2, 3, 4, 4])
+            >>> result = linq.parallel_distinct(4).order_by(lambda x: x).to_list()
+            >>> print(result)
+            [1, 2, 3, 4]
+        """
+        return self.parallel_unique_seen(partitions, processes=processes)
+
+    def parallel_count_by(self, key_func: Callable[[T], K], partitions: int,
+                          processes: Optional[int] = None) -> 'Linq[Tuple[K, int]]':
+        """
+        Counts the elements per key, spilling them into hash partitions that are counted in a process pool.
+
+        Counts are ordered by key within each partition, and the partitions are concatenated.
+        The keys must be hashable, and both the elements and their keys must be picklable.
+
+        Args:
+            key_func (Callable[[T], K]): A function that maps each element of the iterable to a key.
+            partitions (int): The number of partitions.
+            processes (Optional[int]): The number of worker processes. Defaults to the number of CPUs.
+
+        Returns:
+            Linq[Tuple[K, int]]: A new Linq object containing tuples of keys and element counts.
+
+        Raises:
+            ValueError: If `partitions` is less than 1.
+
+        Example:
+            >>> linq = Linq(['apple', 'banana', 'apricot', 'blueberry', 'cherry'])
+            >>> result = linq.parallel_count_by(lambda x: x[0], 4).order_by(lambda x: x[0]).to_list()
+            >>> print(result)
+            [('a', 2), ('b', 2), ('c', 1)]
+        """
+        check_partitions(partitions)
+        return Linq(shuffle(self.iterable, key_func, partitions, count_partition, processes))
+
+    def cached(self, store: Union[ResultCache, PathLike], key: Any,
+               source: Optional[Union[PathLike, Sequence[PathLike]]] = None,
+               hash_source: bool = False) -> 'Linq[T]':
+        """
+        Executes the pipeline once and stores its result on disk, reusing it while the key and source are unchanged.
+
+        The pipeline is fingerprinted from `key` and the modification time and size of the `source` files.
+        On a hit the stored result is streamed back from disk and the remaining lazy steps are never iterated.
+        Eager steps such as `group_by` and `order_by` have already run when the pipeline was built; use
+        `ResultCache.cached` with a builder function to skip them as well.
+
+        Args:
+            store (Union[ResultCache, PathLike]): The store to use, or a directory to open one in.
+            key (Any): A token describing the pipeline, e.g. a name and a version. Change it whenever the
+                pipeline itself changes.
+            source (Optional[Union[PathLike, Sequence[PathLike]]]): The file or files the pipeline reads. Defaults to None.
+            hash_source (bool): If True, the content of the source files is hashed as well. Defaults to False.
+
+        Returns:
+            Linq[T]: A new Linq object streaming the stored elements.
+
+        Example:
+            >>> linq = Linq(['apple', 'banana', 'apricot', 'blueberry'])
+            >>> result = linq.select(str.upper).cached('/tmp/linq-cache', key='fruits-v1').to_list()
+            >>> print(result)
+            ['APPLE', 'BANANA', 'APRICOT', 'BLUEBERRY']
+        """
+        cache = store if isinstance(store, ResultCache) else ResultCache(store)
+        return cache.cached(key, lambda: self, source, hash_source)
+
     def __iter__(self) -> Iterator[T]:
         """
         Returns an iterator for the iterable.
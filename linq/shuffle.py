@@ -0,0 +1,170 @@
+import os
+import pickle
+import tempfile
+
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
+from typing import BinaryIO, Callable, Dict, Generator, Iterable, List, Optional, Sequence, Tuple, Any, Final
+
+from .cache import read_stream, write_stream
+
+Reducer = Callable[[str], str]
+
+HASH_MASK: Final[int] = (1 << 64) - 1
+HASH_MULTIPLIER: Final[int] = 0x9E3779B97F4A7C15
+
+
+def shard_of(key: Any, count: int) -> int:
+    """
+    Maps a key to one of `count` shards.
+
+    The hash is scrambled with a multiplicative hash and the shard is taken from its high bits,
+    so integer keys sharing a stride with `count` still spread across every shard.
+
+    Args:
+        key (Any): A hashable key.
+        count (int): The number of shards.
+
+    Returns:
+        int: The index of the shard, between 0 and `count - 1`.
+
+    Example:
+        >>> len({shard_of(key, 64) for key in range(0, 64 * 1000, 64)})
+        64
+    """
+    scrambled = ((hash(key) & HASH_MASK) * HASH_MULTIPLIER) & HASH_MASK
+    return ((scrambled >> 32) * count) >> 32
+
+
+def check_partitions(count: int) -> None:
+    """
+    Raises a ValueError unless at least one partition is requested.
+
+    Args:
+        count (int): The requested number of partitions.
+    """
+    if count < 1:
+        raise ValueError(f'The number of partitions must be at least 1, got {count}')
+
+
+def partition(items: Iterable[Any], key: Optional[Callable[[Any], Any]], handles: Sequence[BinaryIO],
+              keyed: bool = False) -> None:
+    """
+    Hash-partitions the elements of the iterable across the given files.
+
+    Elements whose keys are equal always land in the same file, so each file can be reduced on its own.
+    The keys must therefore be hashable.
+
+    Args:
+        items (Iterable[Any]): The elements to partition.
+        key (Optional[Callable[[Any], Any]]): A function computing the partition key. Defaults to the element itself.
+        handles (Sequence[BinaryIO]): One binary file opened for writing per partition.
+        keyed (bool): If True, `(key, element)` tuples are written instead of bare elements. Defaults to False.
+    """
+    picklers = [pickle.Pickler(handle, protocol=pickle.HIGHEST_PROTOCOL) for handle in handles]
+    count = len(picklers)
+    for item in items:
+        k = item if key is None else key(item)
+        pickler = picklers[shard_of(k, count)]
+        pickler.dump((k, item) if keyed else item)
+        pickler.clear_memo()
+
+
+def shuffle(items: Iterable[Any], key: Optional[Callable[[Any], Any]], partitions: int, reducer: Reducer,
+            processes: Optional[int] = None) -> Generator[Any, None, None]:
+    """
+    Spills the elements into hash partitions under a temporary directory, reduces every partition
+    in a process pool and streams back the concatenated results.
+
+    The keys are computed in the calling process, so `key` does not need to be picklable. The elements
+    and their keys do.
+
+    Args:
+        items (Iterable[Any]): The elements to shuffle.
+        key (Optional[Callable[[Any], Any]]): A function computing the partition key. Defaults to the element itself.
+        partitions (int): The number of partitions.
+        reducer (Reducer): A module-level function reading a partition file of `(key, element)` records
+            and returning the path of a file holding its results.
+        processes (Optional[int]): The number of worker processes. Defaults to the number of CPUs.
+
+    Yields:
+        Any: The results of every partition, one partition after the other.
+    """
+    with tempfile.TemporaryDirectory(prefix='linq-shuffle-') as directory:
+        paths = [os.path.join(directory, f'partition-{index}.pickle') for index in range(partitions)]
+        handles = [open(path, 'wb') for path in paths]
+        try:
+            partition(items, key, handles, keyed=True)
+        finally:
+            for handle in handles:
+                handle.close()
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            outputs = list(pool.map(reducer, paths))
+        for output in outputs:
+            yield from read_stream(output)
+
+
+def _consume(path: str) -> Generator[Tuple[Any, Any], None, None]:
+    try:
+        yield from read_stream(path)
+    finally:
+        os.remove(path)
+
+
+def _emit(path: str, results: Iterable[Any]) -> str:
+    output = path + '.out'
+    with open(output, 'wb') as handle:
+        write_stream(handle, results)
+    return output
+
+
+def group_partition(path: str) -> str:
+    """
+    Groups a partition by key, ordering the groups by key like `Linq.group_by`.
+
+    Args:
+        path (str): A partition file of `(key, element)` records. It is removed once read.
+
+    Returns:
+        str: The path of a file holding `(key, elements)` records.
+    """
+    groups: Dict[Any, List[Any]] = {}
+    for k, item in _consume(path):
+        groups.setdefault(k, []).append(item)
+    return _emit(path, sorted(groups.items(), key=itemgetter(0)))
+
+
+def unique_partition(path: str) -> str:
+    """
+    Keeps the first element seen for every key of a partition.
+
+    Args:
+        path (str): A partition file of `(key, element)` records. It is removed once read.
+
+    Returns:
+        str: The path of a file holding the unique elements, in the order they were first seen.
+    """
+
+    def unique(records: Iterable[Tuple[Any, Any]]) -> Generator[Any, None, None]:
+        seen = set()
+        for k, item in records:
+            if k not in seen:
+                seen.add(k)
+                yield item
+
+    return _emit(path, unique(_consume(path)))
+
+
+def count_partition(path: str) -> str:
+    """
+    Counts the elements of a partition by key, ordering the counts by key.
+
+    Args:
+        path (str): A partition file of `(key, element)` records. It is removed once read.
+
+    Returns:
+        str: The path of a file holding `(key, count)` records.
+    """
+    counts = Counter(k for k, _ in _consume(path))
+    return _emit(path, sorted(counts.items(), key=itemgetter(0)))
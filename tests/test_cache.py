@@ -0,0 +1,130 @@
+import gc
+import os
+import tempfile
+import unittest
+import warnings
+
+from linq import Linq, ResultCache
+
+
+class TestCache(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = ResultCache(os.path.join(self.tmp.name, 'store'))
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_cached_hit_skips_build(self) -> None:
+        calls = []
+
+        def build() -> Linq[int]:
+            calls.append(None)
+            return Linq([3, 1, 2]).select(lambda x: x * 2).order_by(lambda x: x)
+
+        self.assertEqual(self.store.cached('double', build).to_list(), [2, 4, 6])
+        self.assertEqual(self.store.cached('double', build).to_list(), [2, 4, 6])
+        self.assertEqual(len(calls), 1)
+
+    def test_cached_hit_skips_lazy_pipeline(self) -> None:
+        calls = []
+
+        def parse(x: int) -> int:
+            calls.append(x)
+            return x * 2
+
+        result = Linq([1, 2, 3]).select(parse).cached(self.store, key='double').to_list()
+        self.assertEqual(result, [2, 4, 6])
+        result = Linq([1, 2, 3]).select(parse).cached(self.store, key='double').to_list()
+        self.assertEqual(result, [2, 4, 6])
+        self.assertEqual(len(calls), 3)
+
+    def test_cached_source_change_invalidates(self) -> None:
+        path = os.path.join(self.tmp.name, 'data.txt')
+        with open(path, 'w') as fh:
+            fh.write('a\nb\n')
+
+        def read() -> Linq[str]:
+            with open(path) as fh:
+                return Linq(fh.read().split()).cached(self.store, key='lines', source=path, hash_source=True)
+
+        self.assertEqual(read().to_list(), ['a', 'b'])
+        with open(path, 'w') as fh:
+            fh.write('a\nb\nc\n')
+        self.assertEqual(read().to_list(), ['a', 'b', 'c'])
+
+    def test_cached_source_path_spelling_hits(self) -> None:
+        path = os.path.join(self.tmp.name, 'data.txt')
+        with open(path, 'w') as fh:
+            fh.write('a\n')
+
+        calls = []
+        cwd = os.getcwd()
+        os.chdir(self.tmp.name)
+        try:
+            for source in ('data.txt', './data.txt', path):
+                Linq(['a']).select(calls.append).cached(self.store, key='lines', source=source).to_list()
+        finally:
+            os.chdir(cwd)
+        self.assertEqual(len(calls), 1)
+
+    def test_evicts_to_max_entries(self) -> None:
+        store = ResultCache(self.store.directory, max_entries=2)
+        for key in ('a', 'b', 'c'):
+            Linq([key]).cached(store, key=key).to_list()
+        self.assertEqual(len(store.entries()), 2)
+
+        calls = []
+        result = Linq([1]).select(calls.append).cached(store, key='c').to_list()
+        self.assertEqual(result, ['c'])
+        self.assertEqual(calls, [])
+
+    def test_hit_protects_entry_from_eviction(self) -> None:
+        store = ResultCache(self.store.directory, max_entries=2)
+        Linq(['a']).cached(store, key='a').to_list()
+        Linq(['b']).cached(store, key='b').to_list()
+        Linq(['a']).cached(store, key='a').to_list()
+        Linq(['c']).cached(store, key='c').to_list()
+
+        calls = []
+        result = Linq([1]).select(calls.append).cached(store, key='a').to_list()
+        self.assertEqual(result, ['a'])
+        self.assertEqual(calls, [])
+
+    def test_removes_stale_temporary_files(self) -> None:
+        stale = os.path.join(self.store.directory, '.crashed.tmp')
+        fresh = os.path.join(self.store.directory, '.writing.tmp')
+        for path in (stale, fresh):
+            with open(path, 'wb') as fh:
+                fh.write(b'partial')
+        os.utime(stale, (0, 0))
+
+        Linq([1]).cached(self.store, key='one').to_list()
+        self.assertFalse(os.path.exists(stale))
+        self.assertTrue(os.path.exists(fresh))
+
+        self.store.stale_after = 0
+        self.store.clear()
+        self.assertEqual(os.listdir(self.store.directory), [])
+
+    def test_unused_result_holds_no_file(self) -> None:
+        Linq([1]).cached(self.store, key='one').to_list()
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always', ResourceWarning)
+            result = Linq([1]).cached(self.store, key='one')
+            del result
+            gc.collect()
+        self.assertEqual([w for w in caught if issubclass(w.category, ResourceWarning)], [])
+
+    def test_failed_pipeline_is_not_stored(self) -> None:
+        def fail(x: int) -> int:
+            raise ValueError(x)
+
+        with self.assertRaises(ValueError):
+            Linq([1]).select(fail).cached(self.store, key='fail')
+        self.assertEqual(os.listdir(self.store.directory), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+import os
+import tempfile
+import unittest
+
+from linq import Linq
+from linq.shuffle import shard_of
+
+
+class TestShuffle(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.tempdir = tempfile.tempdir
+        tempfile.tempdir = self.tmp.name
+
+    def tearDown(self) -> None:
+        tempfile.tempdir = self.tempdir
+        self.tmp.cleanup()
+
+    def test_partition_by(self) -> None:
+        linq = Linq([1, 2, 3, 4, 5, 6])
+        result = linq.partition_by(lambda x: x % 2, 2).select(lambda shard: shard.to_list()).to_list()
+        self.assertEqual(result, [[2, 4, 6], [1, 3, 5]])
+
+    def test_partition_by_spill(self) -> None:
+        linq = Linq(['apple', 'banana', 'apricot', 'blueberry', 'cherry'])
+        shards = linq.partition_by(lambda x: x[0], 2, spill=True).select(lambda shard: shard.to_list()).to_list()
+        self.assertEqual(sorted(item for shard in shards for item in shard), sorted(linq))
+        first, second = ({item[0] for item in shard} for shard in shards)
+        self.assertFalse(first & second)
+
+    def test_parallel_group_by(self) -> None:
+        linq = Linq(['apple', 'banana', 'apricot', 'blueberry'])
+        result = linq.parallel_group_by(lambda x: x[0], 4, processes=2).order_by(lambda x: x[0]).to_list()
+        self.assertEqual(result, [('a', ['apple', 'apricot']), ('b', ['banana', 'blueberry'])])
+
+    def test_parallel_unique_seen(self) -> None:
+        linq = Linq(['Apple', 'banana', 'apple', 'Banana', 'CHERRY'])
+        result = linq.parallel_unique_seen(3, key=lambda x: x.lower(), processes=2).order_by(str.lower).to_list()
+        self.assertEqual(result, ['Apple', 'banana', 'CHERRY'])
+
+    def test_parallel_distinct(self) -> None:
+        linq = Linq(list(range(100)) * 3)
+        result = linq.parallel_distinct(4, processes=2).order_by(lambda x: x).to_list()
+        self.assertEqual(result, list(range(100)))
+
+    def test_parallel_count_by(self) -> None:
+        linq = Linq(range(100))
+        result = linq.parallel_count_by(lambda x: x % 3, 2, processes=2).order_by(lambda x: x[0]).to_list()
+        self.assertEqual(result, [(0, 34), (1, 33), (2, 33)])
+
+    def test_shard_of_spreads_strided_keys(self) -> None:
+        shards = {shard_of(key, 64) for key in range(0, 64 * 1000, 64)}
+        self.assertEqual(len(shards), 64)
+
+    def test_rejects_zero_partitions(self) -> None:
+        linq = Linq([1, 2, 3])
+        with self.assertRaises(ValueError):
+            linq.partition_by(lambda x: x, 0)
+        with self.assertRaises(ValueError):
+            linq.parallel_group_by(lambda x: x, 0)
+        with self.assertRaises(ValueError):
+            linq.parallel_distinct(0)
+        with self.assertRaises(ValueError):
+            linq.parallel_count_by(lambda x: x, 0)
+
+    def test_parallel_removes_temporary_directory(self) -> None:
+        Linq(range(100)).parallel_distinct(4, processes=2).to_list()
+        self.assertEqual(os.listdir(self.tmp.name), [])
+
+        result = iter(Linq(range(100)).parallel_distinct(4, processes=2))
+        next(result)
+        self.assertEqual(len(os.listdir(self.tmp.name)), 1)
+        result.close()
+        self.assertEqual(os.listdir(self.tmp.name), [])
+
+    def test_parallel_reducer_error_propagates(self) -> None:
+        with self.assertRaises(TypeError):
+            Linq([1, 'a']).parallel_group_by(lambda x: x, 1, processes=1).to_list()
+        self.assertEqual(os.listdir(self.tmp.name), [])
+
+
+if __name__ == '__main__':
+    unittest.main()